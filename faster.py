@@ -1,49 +1,207 @@
+import re
+import os
 import time
+import atexit
+import hashlib
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+from urllib.robotparser import RobotFileParser
+from bs4 import BeautifulSoup, Tag
 import docx
 from docx.shared import Pt
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
 import threading
+import queue
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
 # --- CONFIGURATION ---
 BASE_URL = "https://romakksilicones.com/"
 WORD_FILENAME = "website_ROMAKK_optimized_selenium.docx"
+PAGES_PER_FILE = 50 # Pages per .docx part; bounds how much of the document is held in memory
 MAX_WORKERS = 5 # Reduced workers slightly as browsers are more resource-intensive
-WAIT_TIME = 2 # Increased wait time for dynamic content to load
+WAIT_TIME = 5 # Upper bound on waiting for dynamic content; pages that are ready sooner return immediately
+_BASE_NETLOC = urlparse(BASE_URL).netloc.lower()
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+_INDEX_PAGES = ('/index.html', '/index.htm', '/index.php')
+_SKIP_RE = re.compile(r'^(?:mailto:|tel:|javascript:|#)|cdn-cgi', re.IGNORECASE) # hrefs that are never crawled
+CONTENT_TAGS = {'h1', 'h2', 'h3', 'h4', 'p', 'table', 'ul', 'ol'}
+TEXT_TAGS = {'h1', 'h2', 'h3', 'h4', 'p'} # Content tags stored as their text
+REQUEST_TIMEOUT = 10 # Seconds to wait for a plain HTTP response
+HEAD_TIMEOUT = 5 # Seconds to wait for the HEAD precheck before opening a page in the browser
+BLOCKED_URL_PATTERNS = [
+    "*.css", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff*", "*.ttf", "*.mp4", "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+
+# --- OPTIMIZATION: One shared HTTP session so keep-alive connections are reused across threads ---
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+_adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS * 2)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# --- OPTIMIZATION: One long-lived Chrome driver per worker process instead of one per URL ---
+DRIVER = None
+
+# robots.txt Crawl-delay, shared by every worker thread/process (see init_throttle)
+_crawl_delay = 0
+_throttle_lock = None
+_next_request = None # multiprocessing.Value holding the earliest time.monotonic() for the next request
+
+WRITER_DONE = object() # Sentinel telling the writer thread the crawl has finished
+SKIPPED = object() # Returned by fetch_with_session for responses that are not HTML pages
+
+# Style ids of the built-in styles in python-docx's default template
+HEADING_STYLE_IDS = {1: 'Heading1', 2: 'Heading2', 3: 'Heading3', 4: 'Heading4'}
+LIST_STYLE_IDS = {False: 'ListBullet', True: 'ListNumber'}
+_XML_INVALID_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]') # Not allowed in XML 1.0
+_RUN_SPLIT_RE = re.compile(r'([\t\r\n])') # Characters python-docx writes as <w:tab/> / <w:br/>
+
+# --- HELPER FUNCTIONS for DOCX ---
+# --- OPTIMIZATION: Paragraphs are built as raw OXML, skipping python-docx's per-call style lookups ---
+def new_document():
+    """Creates an empty document with the body font size applied once to the Normal style."""
+    doc = docx.Document()
+    doc.styles['Normal'].font.size = Pt(11)
+    return doc
+
+def xml_safe(text):
+    """Strips control characters lxml refuses to write (e.g. \\x0b from scraped text)."""
+    return _XML_INVALID_RE.sub('', text)
+
+def _append_paragraph(doc, text, style_id=None):
+    """Appends a <w:p> holding a single run of text, optionally with a paragraph style."""
+    text = xml_safe(text)
+    p = OxmlElement('w:p')
+    if style_id:
+        p_pr = OxmlElement('w:pPr')
+        p_style = OxmlElement('w:pStyle')
+        p_style.set(qn('w:val'), style_id)
+        p_pr.append(p_style)
+        p.append(p_pr)
+    p.append(_text_run(text))
+    _insert_block(doc, p)
+
+def _text_run(text):
+    """
+    Builds a <w:r> for text the way python-docx's run.text does:
+    tabs become <w:tab/>, each CR or LF becomes <w:br/>.
+    """
+    r = OxmlElement('w:r')
+    for piece in _RUN_SPLIT_RE.split(text):
+        if piece == '\t':
+            r.append(OxmlElement('w:tab'))
+        elif piece in ('\r', '\n'):
+            r.append(OxmlElement('w:br'))
+        elif piece:
+            t = OxmlElement('w:t')
+            t.set(qn('xml:space'), 'preserve')
+            t.text = piece
+            r.append(t)
+    return r
+
+def _insert_block(doc, element):
+    """Inserts a block element at the end of the body, keeping the trailing <w:sectPr> last."""
+    body = doc.element.body
+    sect_pr = body.sectPr
+    if sect_pr is not None:
+        sect_pr.addprevious(element)
+    else:
+        body.append(element)
 
-# --- HELPER FUNCTIONS for DOCX (Unchanged) ---
 def add_heading(doc, text, level=1):
-    doc.add_heading(text, level=level)
+    _append_paragraph(doc, text, HEADING_STYLE_IDS[level])
 
 def add_paragraph(doc, text):
-    para = doc.add_paragraph(text)
-    para.style.font.size = Pt(11)
+    _append_paragraph(doc, text)
+
+def add_page_break(doc):
+    p = OxmlElement('w:p')
+    r = OxmlElement('w:r')
+    br = OxmlElement('w:br')
+    br.set(qn('w:type'), 'page')
+    r.append(br)
+    p.append(r)
+    _insert_block(doc, p)
 
-def add_table(doc, bs_table):
-    rows = bs_table.find_all("tr")
+def add_table(doc, rows):
     if not rows:
         return
     max_cols = 0
     for row in rows:
-        max_cols = max(max_cols, len(row.find_all(['td', 'th'])))
+        max_cols = max(max_cols, len(row))
     if max_cols == 0:
         return
     table = doc.add_table(rows=len(rows), cols=max_cols)
     table.style = 'Table Grid'
     for i, row in enumerate(rows):
-        cells = row.find_all(['td', 'th'])
-        for j, cell in enumerate(cells):
+        for j, text in enumerate(row):
             if j < max_cols:
-                table.cell(i, j).text = cell.get_text(strip=True)
+                table.cell(i, j).text = xml_safe(text)
 
 def add_list(doc, items, is_ordered):
-    for i, item in enumerate(items, start=1):
-        text = item.get_text(strip=True)
-        style = 'List Number' if is_ordered else 'List Bullet'
-        doc.add_paragraph(text, style=style)
+    style_id = LIST_STYLE_IDS[is_ordered]
+    for text in items:
+        _append_paragraph(doc, text, style_id)
+
+def write_page(doc, url, content):
+    """Writes one parsed page into the document."""
+    add_heading(doc, f"Page: {url}", level=1)
+    for item_type, *data in content:
+        if item_type == 'heading':
+            add_heading(doc, data[0], level=data[1])
+        elif item_type == 'paragraph':
+            add_paragraph(doc, data[0])
+        elif item_type == 'table':
+            add_table(doc, data[0])
+        elif item_type == 'list':
+            add_list(doc, data[0], is_ordered=data[1])
+    add_page_break(doc)
+
+def part_filename(part):
+    """Name of the part-th .docx file, e.g. website_ROMAKK_optimized_selenium_part0002.docx."""
+    stem, ext = os.path.splitext(WORD_FILENAME)
+    return f"{stem}_part{part:04}{ext}"
+
+def writer(out_q, saved_files, errors):
+    """
+    Writer thread. Drains parsed pages from the queue into the document
+    so the scheduler never blocks on python-docx. Stops at WRITER_DONE.
+    Every PAGES_PER_FILE pages the document is saved as a part file and a
+    fresh one is started, so memory does not grow with the crawl. If the
+    whole crawl fits in one part it is saved as WORD_FILENAME instead.
+    An exception stops the writer; it is appended to errors for main() to
+    re-raise, and whatever was written so far is still saved.
+    """
+    doc = new_document()
+    pages = 0
+    try:
+        while True:
+            item = out_q.get()
+            if item is WRITER_DONE:
+                break
+            if pages == PAGES_PER_FILE:
+                filename = part_filename(len(saved_files) + 1)
+                doc.save(filename)
+                saved_files.append(filename)
+                doc = new_document()
+                pages = 0
+            write_page(doc, *item)
+            pages += 1
+    except Exception as e:
+        errors.append(e)
+    finally:
+        filename = part_filename(len(saved_files) + 1) if saved_files else WORD_FILENAME
+        doc.save(filename)
+        saved_files.append(filename)
 
 # --- CORE LOGIC ---
 
@@ -53,121 +211,362 @@ def get_driver():
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    # --- OPTIMIZATION: Disable image loading ---
+    # --- OPTIMIZATION: Disable image loading (the pref alone is ignored by headless Chrome) ---
     chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
-    return webdriver.Chrome(options=chrome_options)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    # --- OPTIMIZATION: Skip web fonts, preloads and paint holding ---
+    chrome_options.add_argument("--disable-remote-fonts")
+    chrome_options.add_argument("--disable-features=PaintHolding,PreloadMediaEngagementData")
+    chrome_options.add_argument("--disable-user-preload")
+    driver = webdriver.Chrome(options=chrome_options)
+    # --- OPTIMIZATION: Block stylesheets, media and trackers at the network layer so only HTML is transferred ---
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+def add_link(links, url, a):
+    """Adds an <a> tag's href (resolved against url, without query/fragment) to links if it is an internal page."""
+    href = a.get('href')
+    if href is None:
+        return
+    href = href.strip()
+    if _SKIP_RE.search(href):
+        return
+    parsed = urlparse(urljoin(url, href))
+    if _canon_netloc(parsed) == _BASE_NETLOC:
+        links.add(parsed.scheme + "://" + parsed.netloc + parsed.path)
 
 def parse_content_and_links(html_content, url):
-    """Parses HTML to extract content structure and all internal links."""
+    """
+    Parses HTML to extract content structure and all internal links.
+    The body is walked with an explicit stack that never descends into a
+    tag once it has been emitted (or is a nav); links below such tags are
+    picked up with a single find_all instead.
+    """
     if not html_content:
         return [], set()
 
-    soup = BeautifulSoup(html_content, "html.parser")
-    
+    soup = BeautifulSoup(html_content, "lxml")
+    body_content = soup.body
+    if not body_content:
+        return [], set()
+
     links = set()
-    for a in soup.find_all('a', href=True):
-        href = a['href'].strip()
-        if href.startswith(('mailto:', 'tel:', 'javascript:')) or 'cdn-cgi' in href:
+    content_structure = []
+    stack = [body_content]
+    while stack:
+        tag = stack.pop()
+
+        if tag.name == 'nav':
+            # Nav links are still crawled, but nav text is not page content
+            for a in tag.find_all('a', href=True):
+                add_link(links, url, a)
             continue
-        full_url = urljoin(url, href)
-        parsed = urlparse(full_url)
-        if parsed.netloc == urlparse(BASE_URL).netloc:
-            clean_url = parsed.scheme + "://" + parsed.netloc + parsed.path
-            links.add(clean_url)
 
-    content_structure = []
-    for nav in soup.find_all('nav'):
-        nav.decompose()
-        
-    processed_tags = []
-    body_content = soup.body
-    if body_content:
-        for tag in body_content.find_all(['h1', 'h2', 'h3', 'h4', 'p', 'table', 'ul', 'ol'], recursive=True):
-            if any(p in tag.parents for p in processed_tags):
+        if tag.name not in CONTENT_TAGS:
+            if tag.name == 'a':
+                add_link(links, url, tag)
+            # Reversed so that popping keeps document order
+            stack.extend(child for child in reversed(tag.contents) if isinstance(child, Tag))
+            continue
+
+        # Collect links and drop nested navs before any text is read from this subtree
+        for inner in tag.find_all(['a', 'nav']):
+            if inner.decomposed:
                 continue
+            if inner.name == 'a':
+                add_link(links, url, inner)
+            else:
+                for a in inner.find_all('a', href=True):
+                    add_link(links, url, a)
+                inner.decompose()
+
+        # get_text() walks the whole subtree, so compute it once per tag
+        text = tag.get_text(strip=True) if tag.name in TEXT_TAGS else None
+
+        # Tables/lists are flattened to plain text so results can be pickled back from worker processes
+        if tag.name.startswith('h'):
+            try:
+                lvl = int(tag.name[1])
+                content_structure.append(('heading', text, min(lvl, 4)))
+            except (ValueError, IndexError):
+                pass 
+        elif tag.name == 'table':
+            rows = [[cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])] for row in tag.find_all("tr")]
+            content_structure.append(('table', rows))
+        elif tag.name == 'ul':
+            content_structure.append(('list', [li.get_text(strip=True) for li in tag.find_all('li', recursive=False)], False))
+        elif tag.name == 'ol':
+            content_structure.append(('list', [li.get_text(strip=True) for li in tag.find_all('li', recursive=False)], True))
+        elif tag.name == 'p' and text:
+            content_structure.append(('paragraph', text))
 
-            if tag.name.startswith('h'):
-                try:
-                    lvl = int(tag.name[1])
-                    content_structure.append(('heading', tag.get_text(strip=True), min(lvl, 4)))
-                except (ValueError, IndexError):
-                    pass 
-            elif tag.name == 'table':
-                content_structure.append(('table', tag))
-            elif tag.name == 'ul':
-                content_structure.append(('list', tag.find_all('li', recursive=False), False))
-            elif tag.name == 'ol':
-                content_structure.append(('list', tag.find_all('li', recursive=False), True))
-            elif tag.name == 'p' and tag.get_text(strip=True):
-                content_structure.append(('paragraph', tag.get_text(strip=True)))
-
-            processed_tags.append(tag)
-            
     return content_structure, links
 
-def worker(url):
+def _canon_netloc(parsed):
+    """Lower-cased host of a urlparse() result, without the scheme's default port."""
+    netloc = parsed.netloc.lower()
+    default_port = _DEFAULT_PORTS.get(parsed.scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[:-len(default_port)]
+    return netloc
+
+def _canon(parsed):
     """
-    Worker function for each thread. 
-    Uses a dedicated Selenium driver to fetch and parse a page.
+    Canonical URL for a urlparse() result, used for de-duplication.
+    Drops query/fragment, default ports, index pages and trailing slashes (except the root).
     """
-    driver = get_driver()
-    html_content = None
+    path = parsed.path
+    for index_page in _INDEX_PAGES:
+        if path.endswith(index_page):
+            path = path[:-len(index_page)]
+            break
+    path = path.rstrip('/') or '/'
+    return f"{parsed.scheme}://{_canon_netloc(parsed)}{path}"
+
+def url_key(url):
+    """
+    Visited-set key for a URL: a compact 16-byte digest of its canonical form.
+    Only the key is canonical; the URL itself is fetched and used as the urljoin base unchanged.
+    """
+    return hashlib.blake2b(_canon(urlparse(url)).encode(), digest_size=16).digest()
+
+def load_robots():
+    """
+    Fetches and parses the site's robots.txt over the shared session.
+    As with urllib's own reader, 401/403 disallows everything and any other failure allows everything.
+    """
+    robots_url = urljoin(BASE_URL, '/robots.txt')
+    rp = RobotFileParser(robots_url)
+    try:
+        resp = SESSION.get(robots_url, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        print(f"Error fetching {robots_url}: {e}")
+        rp.parse([])
+        return rp
+    if resp.status_code in (401, 403):
+        rp.disallow_all = True
+    elif resp.ok:
+        rp.parse(resp.text.splitlines())
+    rp.modified()
+    return rp
+
+def init_throttle(crawl_delay, lock, next_request):
+    """Installs the shared Crawl-delay throttle in this process (also used as a worker-process initializer)."""
+    global _crawl_delay, _throttle_lock, _next_request
+    _crawl_delay = crawl_delay
+    _throttle_lock = lock
+    _next_request = next_request
+
+def wait_for_crawl_slot():
+    """Blocks until Crawl-delay seconds have passed since the last request sent by any worker."""
+    if not _crawl_delay:
+        return
+    with _throttle_lock:
+        delay = _next_request.value - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        _next_request.value = time.monotonic() + _crawl_delay
+
+def has_body_text(html_content):
+    """Returns True if the static HTML already contains visible body text (i.e. is not JS-rendered)."""
+    if not html_content:
+        return False
+    body = BeautifulSoup(html_content, "lxml").body
+    return bool(body and body.get_text(strip=True))
+
+def is_html_response(resp):
+    """True if the response is an HTML page."""
+    return resp.headers.get('Content-Type', '').lower().startswith('text/html')
+
+def fetch_with_session(url):
+    """
+    Fetches a page over the shared keep-alive HTTP session.
+    Returns (final_url, html) where final_url is the URL after redirects.
+    The body is streamed so non-HTML links (PDFs, archives, images) are dropped
+    after the headers; for those html is SKIPPED, for fetch errors it is None.
+    """
+    wait_for_crawl_slot()
+    try:
+        with SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+            resp.raise_for_status()
+            if not is_html_response(resp):
+                return resp.url, SKIPPED
+            return resp.url, resp.text
+    except requests.RequestException as e:
+        print(f"Error fetching {url}: {e}")
+        return url, None
+
+def should_open_in_browser(url):
+    """
+    Cheap HEAD precheck (over the keep-alive session) before a page is opened in Selenium.
+    Only skips on definite answers: a successful response that is not HTML, or a redirect
+    off the site. Errors (405/501 for unsupported HEAD, but also 401/403/429 from anti-bot
+    rules that block plain HTTP clients, and 5xx) leave the decision to the browser.
+    """
+    wait_for_crawl_slot()
+    try:
+        resp = SESSION.head(url, allow_redirects=True, timeout=HEAD_TIMEOUT)
+    except requests.RequestException:
+        return True
+    if resp.status_code >= 400:
+        return True
+    if not is_html_response(resp):
+        return False
+    return _canon_netloc(urlparse(resp.url)) == _BASE_NETLOC
+
+def init_worker_process(crawl_delay, lock, next_request):
+    """ProcessPoolExecutor initializer: shares the throttle and starts this process's browser."""
+    init_throttle(crawl_delay, lock, next_request)
+    init_process_driver()
+
+def init_process_driver():
+    """ProcessPoolExecutor initializer: starts the one browser this worker process reuses for every page."""
+    global DRIVER
+    DRIVER = get_driver()
+    atexit.register(DRIVER.quit)
+
+def page_is_ready(driver):
+    """True once the DOM is complete and any jQuery AJAX calls have finished."""
+    return driver.execute_script(
+        "return document.readyState === 'complete' && (!window.jQuery || window.jQuery.active === 0);"
+    )
+
+def fetch_with_selenium(url):
+    """
+    Fallback fetcher for JS-rendered sites: reuses this process's Selenium driver.
+    Returns (final_url, html) like fetch_with_session.
+    """
+    if DRIVER is None:
+        init_process_driver()
+    driver = DRIVER
+    final_url, html_content = url, None
+    wait_for_crawl_slot()
     try:
         driver.get(url)
-        time.sleep(WAIT_TIME)  # Wait for dynamic content to load
-        html_content = driver.page_source
+        try:
+            WebDriverWait(driver, WAIT_TIME).until(page_is_ready)  # Wait for dynamic content to load
+        except TimeoutException:
+            pass # Slow page: take whatever has rendered so far
+        final_url, html_content = driver.current_url, driver.page_source
+        driver.delete_all_cookies() # Start every page with a clean session
     except Exception as e:
         print(f"Error fetching {url} with Selenium: {e}")
-    finally:
-        driver.quit() # Ensure the browser is closed to free resources
-    
-    return url, parse_content_and_links(html_content, url)
+    return final_url, html_content
+
+def worker(url, use_selenium=False):
+    """
+    Worker function, run in a thread (requests) or a process (Selenium).
+    Fetches a page (plain HTTP by default, Selenium for JS-rendered sites) and parses it.
+    Returns (url, None) for URLs that turned out not to be HTML pages.
+    """
+    if use_selenium and not should_open_in_browser(url):
+        return url, None
+    fetch = fetch_with_selenium if use_selenium else fetch_with_session
+    final_url, html_content = fetch(url)
+    if html_content is SKIPPED:
+        return url, None
+    # Resolve relative links against where the page really is (keeps /a/ vs /a and follows redirects)
+    return url, parse_content_and_links(html_content, final_url)
 
 def main():
     """Main function to manage the crawling process."""
-    doc = docx.Document()
-    visited_urls = set()
+    visited_urls = set() # url_key() digests of every URL already scheduled
     visited_lock = threading.Lock()
     
     start_time = time.time()
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    out_q = queue.Queue()
+    saved_files = []
+    writer_errors = []
+    writer_thread = threading.Thread(target=writer, args=(out_q, saved_files, writer_errors), daemon=True)
+    writer_thread.start()
+
+    # Skip pages robots.txt disallows and space out requests by its Crawl-delay.
+    # The throttle's lock and timestamp are multiprocessing objects so worker processes share them too.
+    robots = load_robots()
+    crawl_delay = robots.crawl_delay(USER_AGENT) or 0
+    mp_context = multiprocessing.get_context("spawn")
+    throttle_args = (crawl_delay, mp_context.Lock(), mp_context.Value('d', 0.0, lock=False))
+    init_throttle(*throttle_args)
+    pages_crawled = 0
+
+    start_url = BASE_URL
+    if not robots.can_fetch(USER_AGENT, start_url):
+        out_q.put(WRITER_DONE)
+        writer_thread.join()
+        print(f"robots.txt disallows {start_url}; nothing to crawl")
+        return
+
+    # Probe the start page: only fall back to Selenium if the static HTML has no body text
+    start_final_url, start_html = fetch_with_session(start_url)
+    use_selenium = start_html is not SKIPPED and not has_body_text(start_html)
+    print(f"Fetching pages with {'Selenium' if use_selenium else 'requests'}")
+
+    if use_selenium:
+        # WebDriver is not thread-safe: give each worker process its own long-lived browser.
+        # "spawn" avoids forking while the writer thread is running and lets atexit quit the driver.
+        executor = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=mp_context,
+                                       initializer=init_worker_process, initargs=throttle_args)
+    else:
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    with executor:
         with visited_lock:
-            visited_urls.add(BASE_URL)
+            visited_urls.add(url_key(start_url))
         
-        futures = {executor.submit(worker, BASE_URL)}
+        if use_selenium:
+            futures = {executor.submit(worker, start_url, use_selenium)}
+        else:
+            # The probe already fetched the start page; parse it here instead of fetching it again
+            probe = Future()
+            probe.set_result((start_url, None if start_html is SKIPPED else parse_content_and_links(start_html, start_final_url)))
+            futures = {probe}
         
         while futures:
-            for future in as_completed(futures):
-                url, (content, new_links) = future.result()
-                futures.remove(future)
+            if not writer_thread.is_alive():
+                # Nothing would save further pages: drop queued work and stop crawling
+                for future in futures:
+                    future.cancel()
+                break
+
+            # Handle each page as soon as it finishes so new links are submitted without waiting for the rest
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                url, result = future.result()
+                if result is None:
+                    print(f"Skipped (not an HTML page): {url}")
+                    continue
+                content, new_links = result
+                pages_crawled += 1
 
                 print(f"Processed: {url} ({len(visited_urls)} pages discovered)")
 
-                # Write content to docx
-                add_heading(doc, f"Page: {url}", level=1)
-                for item_type, *data in content:
-                    if item_type == 'heading':
-                        add_heading(doc, data[0], level=data[1])
-                    elif item_type == 'paragraph':
-                        add_paragraph(doc, data[0])
-                    elif item_type == 'table':
-                        add_table(doc, data[0])
-                    elif item_type == 'list':
-                        add_list(doc, data[0], is_ordered=data[1])
-                doc.add_page_break()
-
-                for link in new_links:
-                    with visited_lock:
-                        if link not in visited_urls:
-                            visited_urls.add(link)
-                            futures.add(executor.submit(worker, link))
+                # Hand the content to the writer thread and go straight back to scheduling
+                out_q.put((url, content))
+
+                # One lock acquisition per page rather than per link; submit outside the lock
+                # Keyed by url_key() so variants of one page found together are submitted once
+                candidates = {url_key(link): link for link in new_links}
+                with visited_lock:
+                    fresh_links = [link for key, link in candidates.items() if key not in visited_urls]
+                    visited_urls.update(candidates)
+
+                for link in fresh_links:
+                    if not robots.can_fetch(USER_AGENT, link):
+                        continue
+                    futures.add(executor.submit(worker, link, use_selenium))
     
-    doc.save(WORD_FILENAME)
+    out_q.put(WRITER_DONE)
+    writer_thread.join()
+    if writer_errors:
+        raise RuntimeError(f"Writing the document failed; partial output saved to {', '.join(saved_files)}") from writer_errors[0]
+    if not saved_files:
+        raise RuntimeError("Writer thread stopped without saving the document")
     end_time = time.time()
 
     print("\n--- Crawling Complete ---")
-    print(f"Saved content from {len(visited_urls)} pages to {WORD_FILENAME}")
+    print(f"Saved content from {pages_crawled} pages to {', '.join(saved_files)}")
     print(f"Total time taken: {end_time - start_time:.2f} seconds")
 
 if __name__ == "__main__":
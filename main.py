@@ -1,5 +1,6 @@
 import os
 import time
+from collections import deque
 from urllib.parse import urlparse, urljoin
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -11,6 +12,7 @@ from docx.shared import Pt
 BASE_URL = "https://romakksilicones.com/"  # Change as needed
 WORD_FILENAME = "website_romakk.docx"
 WAIT_TIME = 0  # seconds to wait for JS/dynamic content
+BASE_NETLOC = urlparse(BASE_URL).netloc
 
 # Selenium Setup (Headless Chrome)
 chrome_options = Options()
@@ -100,25 +102,28 @@ def parse_and_save_content(soup):
 
     # Extract content in order respecting headings, tables, lists, paragraphs
     # We need to prevent double-processing of content inside tables/lists
-    processed_tags = []
+    processed_ids = set()
     for tag in soup.body.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'table', 'ul', 'ol'], recursive=True):
         # Skip if this tag is inside another tag we've already processed (e.g., a p inside a table cell)
-        if any(p in tag.parents for p in processed_tags):
+        if any(id(p) in processed_ids for p in tag.parents):
             continue
 
+        # get_text() walks the whole subtree, so compute it once per tag
+        text = tag.get_text(strip=True) if tag.name in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p') else None
+
         if tag.name.startswith('h'):
             lvl = int(tag.name[1]) if tag.name[1].isdigit() else 1
-            add_heading(tag.get_text(strip=True), min(lvl, 4))
+            add_heading(text, min(lvl, 4))
         elif tag.name == 'table':
             add_table(tag)
         elif tag.name == 'ul':
             add_list(tag.find_all('li', recursive=False), is_ordered=False)
         elif tag.name == 'ol':
             add_list(tag.find_all('li', recursive=False), is_ordered=True)
-        elif tag.name == 'p' and tag.get_text(strip=True):
-            add_paragraph(tag.get_text(strip=True))
+        elif tag.name == 'p' and text:
+            add_paragraph(text)
 
-        processed_tags.append(tag)
+        processed_ids.add(id(tag))
 
 
 def extract_links(soup, base_url):
@@ -130,35 +135,39 @@ def extract_links(soup, base_url):
         full_url = urljoin(base_url, href)
         parsed = urlparse(full_url)
         # Ensure we only crawl links on the same domain
-        if parsed.netloc == urlparse(BASE_URL).netloc:
+        if parsed.netloc == BASE_NETLOC:
             # Clean fragments and query parameters
             clean_url = parsed.scheme + "://" + parsed.netloc + parsed.path
             links.add(clean_url)
 
     return links
 
-def crawl(url, depth=0, max_depth=200):
-    if url in visited or depth > max_depth:
-        return
-    visited.add(url)
-    print(f"Crawling: {url} at depth {depth}")
-    try:
-        driver.get(url)
-        time.sleep(WAIT_TIME)
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Extract links first from the original soup
-        links = extract_links(soup, url)
-
-        # Now parse and save the content (which modifies the soup by removing navs)
-        add_heading(f"Page: {url}", level=1)
-        parse_and_save_content(soup)
-
-        for link in links:
-            if link not in visited:
-                crawl(link, depth + 1, max_depth)
-    except Exception as e:
-        print(f"Failed URL: {url} due to {e}")
+def crawl(start_url, max_depth=200, max_pages=None):
+    """Breadth-first crawl from start_url using an explicit queue instead of recursion."""
+    frontier = deque([(start_url, 0)])
+    while frontier:
+        if max_pages is not None and len(visited) >= max_pages:
+            break
+        url, depth = frontier.popleft()
+        if url in visited or depth > max_depth:
+            continue
+        visited.add(url)
+        print(f"Crawling: {url} at depth {depth}")
+        try:
+            driver.get(url)
+            time.sleep(WAIT_TIME)
+            soup = BeautifulSoup(driver.page_source, "lxml")
+            
+            # Extract links first from the original soup
+            links = extract_links(soup, url)
+
+            # Now parse and save the content (which modifies the soup by removing navs)
+            add_heading(f"Page: {url}", level=1)
+            parse_and_save_content(soup)
+
+            frontier.extend((link, depth + 1) for link in links - visited)
+        except Exception as e:
+            print(f"Failed URL: {url} due to {e}")
 
 def main():
     crawl(BASE_URL)